@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class CmsserverConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "CMSServer"
+
+    def ready(self):
+        from . import signals  # noqa: F401
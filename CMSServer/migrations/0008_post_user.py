@@ -0,0 +1,37 @@
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_post_user(apps, schema_editor):
+    Blog = apps.get_model("CMSServer", "Blog")
+    Post = apps.get_model("CMSServer", "Post")
+    Post.objects.update(
+        user_id=Subquery(
+            Blog.objects.filter(pk=OuterRef("blog_id")).values("user_id")[:1]
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("CMSServer", "0007_alter_blog_title_alter_post_title_alter_tag_name"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="post",
+            name="user",
+            field=models.ForeignKey(
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="posts",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.RunPython(backfill_post_user, migrations.RunPython.noop),
+    ]
@@ -42,10 +42,25 @@ class Post(models.Model):
     published_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     blog = models.ForeignKey(Blog, on_delete=models.CASCADE, related_name="posts")
+    # Denormalized copy of blog.user so owner-scoped post queries can filter
+    # without joining Blog. Post.save() copies it from the blog and
+    # CMSServer.signals resyncs posts when a blog changes owner. Blog
+    # QuerySet.update(user=...) and Post bulk_create bypass both.
+    user = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="posts", editable=False
+    )
 
     def __str__(self):
         return self.title
 
+    def save(self, *args, **kwargs):
+        if self.blog_id is not None:
+            self.user_id = self.blog.user_id
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and {"blog", "blog_id"} & set(update_fields):
+            kwargs["update_fields"] = {*update_fields, "user"}
+        super().save(*args, **kwargs)
+
 
 class Tag(models.Model):
     name = models.CharField(
@@ -0,0 +1,32 @@
+from django.db.models.signals import post_save, pre_save
+from django.dispatch import receiver
+from .models import Blog
+
+
+_OWNER_FIELDS = frozenset({"user", "user_id"})
+
+
+def _owner_may_change(update_fields) -> bool:
+    return update_fields is None or not _OWNER_FIELDS.isdisjoint(update_fields)
+
+
+@receiver(pre_save, sender=Blog)
+def store_blog_previous_user(sender, instance, update_fields=None, **kwargs):
+    instance._previous_user_id = None
+    if kwargs.get("raw"):
+        return
+    if instance.pk is not None and _owner_may_change(update_fields):
+        instance._previous_user_id = (
+            Blog.objects.filter(pk=instance.pk)
+            .values_list("user_id", flat=True)
+            .first()
+        )
+
+
+@receiver(post_save, sender=Blog)
+def sync_blog_posts_user(sender, instance, created, update_fields=None, **kwargs):
+    if kwargs.get("raw") or created or not _owner_may_change(update_fields):
+        return
+    previous_user_id = getattr(instance, "_previous_user_id", None)
+    if previous_user_id is not None and previous_user_id != instance.user_id:
+        instance.posts.update(user_id=instance.user_id)
@@ -0,0 +1,16 @@
+from cachalot.settings import cachalot_settings
+from django.test.runner import DiscoverRunner
+from django.test.utils import override_settings
+
+
+class CMSTestRunner(DiscoverRunner):
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        self._cachalot_override = override_settings(CACHALOT_ENABLED=False)
+        self._cachalot_override.enable()
+        cachalot_settings.reload()
+
+    def teardown_test_environment(self, **kwargs):
+        self._cachalot_override.disable()
+        cachalot_settings.reload()
+        super().teardown_test_environment(**kwargs)
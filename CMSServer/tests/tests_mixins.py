@@ -1,3 +1,4 @@
+from django.contrib import admin
 from django.test import TestCase
 from rest_framework.test import APITestCase
 from rest_framework.exceptions import PermissionDenied
@@ -7,13 +8,19 @@ from unittest.mock import Mock, patch
 from CMSServer.mixins import (
     PostReadonlyFieldsMixin,
     PublicReadOnlyMixin,
+    LimitBlogChoicesToOwnerMixin,
     BlogOwnerPermissionMixin,
     PostOwnerQuerysetViewSetMixin,
     PostEditorMixin,
     FilterPostsByBlogViewSetMixin,
     AuthenticationMixin,
 )
-from CMSServer.tests.factories import UserFactory, BlogFactory, PostFactory
+from CMSServer.tests.factories import (
+    UserFactory,
+    BlogFactory,
+    PostFactory,
+    TagFactory,
+)
 from CMSServer.models import Blog, Post
 from django.test import RequestFactory
 from CMSServer.exceptions import InvalidCredentialsError, AuthenticationError
@@ -106,12 +113,50 @@ class TestPublicReadOnlyMixin(TestCase):
         self.assertEqual(permissions[0].__class__.__name__, "IsAuthenticated")
 
 
-class TestBlogOwnerPermissionMixin(APITestCase):
+class LimitBlogChoicesAdmin(LimitBlogChoicesToOwnerMixin, admin.ModelAdmin):
+    pass
+
+
+class TestLimitBlogChoicesToOwnerMixin(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = UserFactory()
+        cls.blog = BlogFactory(user=cls.user)
+        BlogFactory.create_batch(3)
+
     def setUp(self):
-        self.user = UserFactory()
-        self.other_user = UserFactory()
-        self.blog = BlogFactory(user=self.user)
-        self.other_blog = BlogFactory(user=self.other_user)
+        self.factory = RequestFactory()
+        self.admin = LimitBlogChoicesAdmin(Post, admin.site)
+
+    def test_formfield_limited_to_owner_blog(self):
+        request = self.factory.get("/")
+        request.user = self.user
+        db_field = Post._meta.get_field("blog")
+
+        formfield = self.admin.formfield_for_foreignkey(db_field, request)
+
+        with self.assertNumQueries(1):
+            choices = [label for value, label in formfield.choices if value]
+
+        self.assertEqual(choices, [self.blog.title])
+
+    def test_formfield_superuser_sees_all_blogs(self):
+        request = self.factory.get("/")
+        request.user = UserFactory(is_superuser=True)
+        db_field = Post._meta.get_field("blog")
+
+        formfield = self.admin.formfield_for_foreignkey(db_field, request)
+
+        self.assertEqual(formfield.queryset.count(), Blog.objects.count())
+
+
+class TestBlogOwnerPermissionMixin(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = UserFactory()
+        cls.other_user = UserFactory()
+        cls.blog = BlogFactory(user=cls.user)
+        cls.other_blog = BlogFactory(user=cls.other_user)
 
     def test_get_permissions_list_action(self):
         mixin = BlogOwnerPermissionMixin()
@@ -137,7 +182,7 @@ class TestBlogOwnerPermissionMixin(APITestCase):
         serializer = Mock()
         serializer.save = Mock()
 
-        mixin.get_object = Mock(return_value=self.blog)
+        serializer.instance = self.blog
         mixin.perform_update(serializer)
 
         serializer.save.assert_called_once()
@@ -149,7 +194,7 @@ class TestBlogOwnerPermissionMixin(APITestCase):
         mixin.request.user.is_superuser = False
 
         serializer = Mock()
-        mixin.get_object = Mock(return_value=self.blog)
+        serializer.instance = self.blog
 
         with self.assertRaises(PermissionDenied):
             mixin.perform_update(serializer)
@@ -181,13 +226,14 @@ class TestBlogOwnerPermissionMixin(APITestCase):
 
 
 class TestPostOwnerQuerysetViewSetMixin(TestCase):
-    def setUp(self):
-        self.user = UserFactory()
-        self.other_user = UserFactory()
-        self.blog = BlogFactory(user=self.user)
-        self.other_blog = BlogFactory(user=self.other_user)
-        self.post = PostFactory(blog=self.blog)
-        self.other_post = PostFactory(blog=self.other_blog)
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = UserFactory()
+        cls.other_user = UserFactory()
+        cls.blog = BlogFactory(user=cls.user)
+        cls.other_blog = BlogFactory(user=cls.other_user)
+        cls.post = PostFactory(blog=cls.blog)
+        cls.other_post = PostFactory(blog=cls.other_blog)
 
     def test_get_queryset_authenticated_user(self):
         class TestViewSet(PostOwnerQuerysetViewSetMixin, MockViewSet):
@@ -204,6 +250,39 @@ class TestPostOwnerQuerysetViewSetMixin(TestCase):
         self.assertIn(self.post, queryset)
         self.assertNotIn(self.other_post, queryset)
 
+    def test_get_queryset_fetches_related_in_fixed_queries(self):
+        class TestViewSet(PostOwnerQuerysetViewSetMixin, MockViewSet):
+            pass
+
+        for _ in range(5):
+            blog = BlogFactory()
+            posts = PostFactory.create_batch(2, blog=blog)
+            TagFactory(posts=posts)
+
+        mixin = TestViewSet()
+        mixin.request = Mock()
+        mock_user = Mock()
+        mock_user.is_authenticated = True
+        mock_user.is_superuser = True
+        mixin.request.user = mock_user
+
+        with self.assertNumQueries(2):
+            for post in mixin.get_queryset():
+                post.blog.user.username
+                list(post.tags.all())
+
+    def test_get_queryset_detail_action_skips_tag_prefetch(self):
+        class TestViewSet(PostOwnerQuerysetViewSetMixin, MockViewSet):
+            pass
+
+        mixin = TestViewSet(action="retrieve")
+        mixin.request = Mock()
+        mixin.request.user = self.user
+
+        queryset = mixin.get_queryset()
+
+        self.assertEqual(queryset._prefetch_related_lookups, ())
+
     def test_get_queryset_superuser(self):
         class TestViewSet(PostOwnerQuerysetViewSetMixin, MockViewSet):
             pass
@@ -241,13 +320,14 @@ class TestPostOwnerQuerysetViewSetMixin(TestCase):
 
 
 class TestFilterPostsByBlogViewSetMixin(TestCase):
-    def setUp(self):
-        self.user = UserFactory()
-        self.user2 = UserFactory()
-        self.blog1 = BlogFactory(user=self.user)
-        self.blog2 = BlogFactory(user=self.user2)
-        self.post1 = PostFactory(blog=self.blog1)
-        self.post2 = PostFactory(blog=self.blog2)
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = UserFactory()
+        cls.user2 = UserFactory()
+        cls.blog1 = BlogFactory(user=cls.user)
+        cls.blog2 = BlogFactory(user=cls.user2)
+        cls.post1 = PostFactory(blog=cls.blog1)
+        cls.post2 = PostFactory(blog=cls.blog2)
 
     def test_get_queryset_with_blog_filter(self):
         class TestViewSet(FilterPostsByBlogViewSetMixin, MockViewSet):
@@ -262,6 +342,37 @@ class TestFilterPostsByBlogViewSetMixin(TestCase):
         self.assertIn(self.post1, queryset)
         self.assertNotIn(self.post2, queryset)
 
+    def test_get_queryset_with_invalid_blog_filter(self):
+        class TestViewSet(FilterPostsByBlogViewSetMixin, MockViewSet):
+            pass
+
+        mixin = TestViewSet()
+        mixin.request = Mock()
+        mixin.request.query_params = {"blog_id": "not-a-number"}
+
+        queryset = mixin.get_queryset()
+
+        self.assertFalse(queryset.exists())
+
+    def test_get_queryset_with_owner_mixin_prefetches_tags(self):
+        class TestViewSet(
+            FilterPostsByBlogViewSetMixin, PostOwnerQuerysetViewSetMixin, MockViewSet
+        ):
+            pass
+
+        posts = PostFactory.create_batch(10, blog=self.blog1)
+        TagFactory(posts=posts)
+        TagFactory(posts=posts[:5])
+
+        mixin = TestViewSet()
+        mixin.request = Mock()
+        mixin.request.user = self.user
+        mixin.request.query_params = {"blog_id": str(self.blog1.id)}
+
+        with self.assertNumQueries(2):
+            for post in mixin.get_queryset():
+                list(post.tags.all())
+
     def test_get_queryset_without_filter(self):
         class TestViewSet(FilterPostsByBlogViewSetMixin, MockViewSet):
             pass
@@ -277,9 +388,12 @@ class TestFilterPostsByBlogViewSetMixin(TestCase):
 
 
 class TestAuthenticationMixin(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = UserFactory()
+
     def setUp(self):
         self.mixin = AuthenticationMixin()
-        self.user = UserFactory()
 
     @patch("CMSServer.mixins.authenticate_user")
     def test_authenticate_user_success(self, mock_authenticate):
@@ -317,38 +431,47 @@ class TestAuthenticationMixin(TestCase):
 
 
 class TestPostEditorMixin(APITestCase):
-    def setUp(self):
-        self.user = UserFactory()
-        self.other_user = UserFactory()
-        self.blog = BlogFactory(user=self.user)
-        self.other_blog = BlogFactory(user=self.other_user)
-        self.post = PostFactory(blog=self.blog)
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = UserFactory()
+        cls.other_user = UserFactory()
+        cls.blog = BlogFactory(user=cls.user)
+        cls.other_blog = BlogFactory(user=cls.other_user)
+        cls.post = PostFactory(blog=cls.blog)
 
     def test_perform_create_authenticated_user(self):
         class TestViewSet(PostEditorMixin):
             pass
 
+        user = UserFactory()
         mixin = TestViewSet()
         mixin.request = Mock()
-        mock_user = Mock()
-        mock_user.is_authenticated = True
-        mock_user.blog = None
-        mixin.request.user = mock_user
+        mixin.request.user = user
 
         serializer = Mock()
         serializer.save = Mock()
 
-        with patch("builtins.hasattr") as mock_hasattr:
-            mock_hasattr.return_value = False
+        mixin.perform_create(serializer)
 
-            with patch.object(Blog.objects, "create") as mock_create:
-                mock_blog = Mock()
-                mock_create.return_value = mock_blog
+        blog = Blog.objects.get(user=user)
+        serializer.save.assert_called_once_with(blog=blog)
 
-                mixin.perform_create(serializer)
+    def test_perform_create_reuses_existing_blog(self):
+        class TestViewSet(PostEditorMixin):
+            pass
+
+        mixin = TestViewSet()
+        mixin.request = Mock()
+        mixin.request.user = self.user
+
+        serializer = Mock()
+        serializer.save = Mock()
+
+        with self.assertNumQueries(1):
+            mixin.perform_create(serializer)
 
-                serializer.save.assert_called_once()
-                mock_create.assert_called_once()
+        serializer.save.assert_called_once_with(blog=self.blog)
+        self.assertEqual(Blog.objects.filter(user=self.user).count(), 1)
 
     def test_perform_create_not_authenticated(self):
         class TestViewSet(PostEditorMixin):
@@ -379,7 +502,7 @@ class TestPostEditorMixin(APITestCase):
         serializer = Mock()
         serializer.save = Mock()
 
-        mixin.get_object = Mock(return_value=self.post)
+        serializer.instance = self.post
         mixin.perform_update(serializer)
 
         serializer.save.assert_called_once()
@@ -397,7 +520,7 @@ class TestPostEditorMixin(APITestCase):
         mixin.request.user.is_authenticated = True
 
         serializer = Mock()
-        mixin.get_object = Mock(return_value=self.post)
+        serializer.instance = self.post
 
         with self.assertRaises(DjangoPermissionDenied):
             mixin.perform_update(serializer)
@@ -1,4 +1,8 @@
+from django.core import serializers
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from CMSServer.models import Post
 from CMSServer.tests.factories import UserFactory, BlogFactory, PostFactory, TagFactory
 
 class TestUserCreation(TestCase):
@@ -27,6 +31,89 @@ class TestPostCreation(TestCase):
         self.assertIsNotNone(post.blog)
         self.assertEqual(str(post), post.title)
 
+    def test_post_user_follows_blog_owner(self):
+        post = PostFactory()
+
+        self.assertEqual(post.user, post.blog.user)
+
+    def test_post_user_follows_blog_on_partial_save(self):
+        for field in ("blog", "blog_id"):
+            post = PostFactory()
+            new_blog = BlogFactory()
+
+            post.blog = new_blog
+            post.save(update_fields=[field])
+            post.refresh_from_db()
+
+            self.assertEqual(post.user, new_blog.user)
+
+    def test_post_user_updated_when_blog_owner_changes(self):
+        post = PostFactory()
+        new_owner = UserFactory()
+
+        post.blog.user = new_owner
+        post.blog.save()
+        post.refresh_from_db()
+
+        self.assertEqual(post.user, new_owner)
+
+    def test_post_user_updated_when_blog_owner_saved_by_column(self):
+        post = PostFactory()
+        new_owner = UserFactory()
+
+        post.blog.user_id = new_owner.pk
+        post.blog.save(update_fields=["user_id"])
+        post.refresh_from_db()
+
+        self.assertEqual(post.user, new_owner)
+
+    def test_fixture_load_keeps_post_user(self):
+        user = UserFactory()
+        fixture = [
+            {
+                "model": "CMSServer.post",
+                "pk": 900,
+                "fields": {
+                    "title": "Loaded post",
+                    "content": "Content",
+                    "published_at": "2025-01-01T00:00:00Z",
+                    "updated_at": "2025-01-01T00:00:00Z",
+                    "blog": 900,
+                    "user": user.pk,
+                },
+            },
+            {
+                "model": "CMSServer.blog",
+                "pk": 900,
+                "fields": {
+                    "title": "Loaded blog",
+                    "description": "Description",
+                    "created_at": "2025-01-01T00:00:00Z",
+                    "updated_at": "2025-01-01T00:00:00Z",
+                    "user": user.pk,
+                },
+            },
+        ]
+
+        for obj in serializers.deserialize("python", fixture):
+            obj.save()
+
+        self.assertEqual(Post.objects.get(pk=900).user, user)
+
+    def test_blog_save_without_owner_change_skips_post_update(self):
+        post = PostFactory()
+        blog = post.blog
+
+        blog.title = "Renamed blog"
+        with CaptureQueriesContext(connection) as ctx:
+            blog.save()
+
+        post_updates = [
+            q["sql"] for q in ctx.captured_queries
+            if q["sql"].startswith("UPDATE") and "CMSServer_post" in q["sql"]
+        ]
+        self.assertEqual(post_updates, [])
+
 class TestTagCreation(TestCase):
     def test_tag_creation(self):
         tag = TagFactory()
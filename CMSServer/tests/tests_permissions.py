@@ -1,6 +1,19 @@
 from django.test import TestCase
 from CMSServer.tests.factories import UserFactory, BlogFactory, PostFactory
 from CMSServer.permissions import can_view_post, can_add_post, can_edit_post
+from django.contrib.auth.models import AnonymousUser
+from unittest.mock import Mock
+from CMSServer.mixins import PostOwnerQuerysetViewSetMixin
+from CMSServer.models import Post
+
+
+class PostQuerysetBase:
+    def get_queryset(self):
+        return Post.objects.all()
+
+
+class PostQuerysetViewSet(PostOwnerQuerysetViewSetMixin, PostQuerysetBase):
+    pass
 
 
 class TestPermissions(TestCase):
@@ -19,6 +32,19 @@ class TestPermissions(TestCase):
         post = PostFactory(blog=BlogFactory(user=user))
         self.assertTrue(can_edit_post(user, post))
 
+    def test_can_edit_post_from_viewset_queryset_runs_no_queries(self):
+        owner = UserFactory()
+        post = PostFactory(blog=BlogFactory(user=owner))
+
+        for user, expected in ((AnonymousUser(), False), (owner, True)):
+            viewset = PostQuerysetViewSet()
+            viewset.action = "retrieve"
+            viewset.request = Mock(user=user)
+            fetched = viewset.get_queryset().get(pk=post.pk)
+
+            with self.assertNumQueries(0):
+                self.assertEqual(can_edit_post(user, fetched), expected)
+
     def test_can_edit_blog(self):
         user = UserFactory()
         blog = BlogFactory(user=user)
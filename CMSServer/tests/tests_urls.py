@@ -1,36 +1,39 @@
+from unittest.mock import patch
+from django.contrib.auth import authenticate
+from django.core.cache import cache
 from django.test import TestCase
 from django.urls import reverse
-from django.test import Client
 from CMSServer.tests.factories import UserFactory, BlogFactory, PostFactory, TagFactory
 import json
 
 
 class TestUrls(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = UserFactory()
+        cls.blog = BlogFactory(user=cls.user)
+        cls.post = PostFactory(blog=cls.blog)
+        cls.tag = TagFactory()
+
     def setUp(self):
-        self.client = Client()
-        self.user = UserFactory()
-        self.blog = BlogFactory(user=self.user)
-        self.post = PostFactory(blog=self.blog)
-        self.tag = TagFactory()
+        self.client.force_login(self.user)
 
     def test_admin_url(self):
+        self.client.logout()
         response = self.client.get("/admin/")
         self.assertEqual(response.status_code, 302)
 
     def test_blog_detail_url(self):
-        self.client.force_login(self.user)
         url = reverse("blog-detail", args=[self.blog.id])
         response = self.client.get(url)
         self.assertEqual(response.status_code, 200)
 
     def test_blog_list_url(self):
-        self.client.force_login(self.user)
         url = reverse("blog-list")
         response = self.client.get(url)
         self.assertEqual(response.status_code, 200)
 
     def test_blog_update_url(self):
-        self.client.force_login(self.user)
         url = reverse("blog-detail", kwargs={"pk": self.blog.id})
         data = {"title": "Updated Blog", "description": "Updated Description"}
         response = self.client.put(
@@ -39,13 +42,23 @@ class TestUrls(TestCase):
         self.assertEqual(response.status_code, 200)
 
     def test_blog_delete_url(self):
-        self.client.force_login(self.user)
         url = reverse("blog-detail", args=[self.blog.id])
         response = self.client.delete(url)
         self.assertEqual(response.status_code, 204)
 
     def test_post_detail_url(self):
-        self.client.force_login(self.user)
         url = reverse("post-detail", args=[self.post.id])
         response = self.client.get(url)
         self.assertEqual(response.status_code, 200)
+
+    def test_login_url_reuses_cached_authentication(self):
+        cache.clear()
+        url = reverse("auth-login")
+        data = {"username": self.user.username, "password": "defaultpassword123"}
+        with patch("CMSServer.utils.authenticate", wraps=authenticate) as mock_auth:
+            first = self.client.post(url, data)
+            second = self.client.post(url, data)
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(first.json()["token"], second.json()["token"])
+        mock_auth.assert_called_once()
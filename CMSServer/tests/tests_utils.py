@@ -1,3 +1,6 @@
+from unittest.mock import patch
+from django.contrib.auth import authenticate
+from django.core.cache import cache
 from django.test import TestCase
 from CMSServer.tests.factories import UserFactory, BlogFactory, PostFactory
 from CMSServer.utils import (
@@ -14,6 +17,9 @@ from rest_framework.authtoken.models import Token
 
 
 class TestUtils(TestCase):
+    def setUp(self):
+        cache.clear()
+
     def test_is_superuser(self):
         user = UserFactory(is_superuser=False)
         self.assertFalse(is_superuser(user))
@@ -45,6 +51,11 @@ class TestUtils(TestCase):
         self.assertEqual(filtered_posts2.count(), 1)
         self.assertEqual(filtered_posts2[0].id, post2.id)
 
+    def test_filter_posts_by_blog_invalid_id(self):
+        PostFactory()
+        self.assertEqual(filter_posts_by_blog(Post.objects.all(), "abc").count(), 0)
+        self.assertEqual(filter_posts_by_blog(Post.objects.all(), None).count(), 1)
+
     def test_authenticate_user(self):
         user = UserFactory(password="password")
         authenticated_user = authenticate_user(user.username, "password")
@@ -52,6 +63,28 @@ class TestUtils(TestCase):
         authenticated_user = authenticate_user(user.username, "wrong_password")
         self.assertIsNone(authenticated_user)
 
+    def test_authenticate_user_caches_success(self):
+        user = UserFactory(password="password")
+        with patch("CMSServer.utils.authenticate", wraps=authenticate) as mock_auth:
+            authenticate_user(user.username, "password")
+            authenticated_user = authenticate_user(user.username, "password")
+        self.assertEqual(authenticated_user.id, user.id)
+        mock_auth.assert_called_once()
+
+    def test_authenticate_user_does_not_cache_failure(self):
+        user = UserFactory(password="password")
+        with patch("CMSServer.utils.authenticate", wraps=authenticate) as mock_auth:
+            authenticate_user(user.username, "wrong_password")
+            authenticate_user(user.username, "wrong_password")
+        self.assertEqual(mock_auth.call_count, 2)
+
+    def test_authenticate_user_cache_dropped_on_password_change(self):
+        user = UserFactory(password="password")
+        authenticate_user(user.username, "password")
+        user.set_password("new_password")
+        user.save()
+        self.assertIsNone(authenticate_user(user.username, "password"))
+
     def test_create_user_token(self):
         user = UserFactory()
         token = create_user_token(user)
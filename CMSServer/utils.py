@@ -3,6 +3,8 @@ from django.contrib.auth.models import User
 from CMSServer.models import Blog
 from rest_framework.authtoken.models import Token
 from django.contrib.auth import authenticate
+from django.core.cache import cache
+from django.utils.crypto import constant_time_compare, salted_hmac
 import logging
 
 logger = logging.getLogger(__name__)
@@ -21,18 +23,45 @@ def is_blog_owner(user: Optional[User], blog: Blog) -> bool:
 
 
 def filter_posts_by_blog(queryset, blog_id):
-    if blog_id:
-        try:
-            blog_id = int(blog_id)
-            return queryset.filter(blog_id=blog_id)
-        except (ValueError, TypeError):
-            return queryset
-    return queryset
+    if not blog_id:
+        return queryset
+    try:
+        blog_id = int(blog_id)
+    except (ValueError, TypeError):
+        return queryset.none()
+    return queryset.filter(blog_id=blog_id)
+
+
+# Successful logins are remembered briefly so client retry storms do not
+# re-run the password hasher. Failures are never cached, and a cached entry
+# stores the session auth hash, so it stops matching once the password changes.
+AUTH_CACHE_TTL = 5
+
+
+def _auth_cache_key(username: str, password: str) -> str:
+    digest = salted_hmac("cms-auth", f"{username}\0{password}").hexdigest()
+    return f"cms:auth:{digest}"
 
 
 def authenticate_user(username: str, password: str) -> Optional[User]:
+    key = _auth_cache_key(username, password)
+    cached = cache.get(key)
+    if cached is not None:
+        user_pk, auth_hash, backend = cached
+        user = User.objects.filter(pk=user_pk, is_active=True).first()
+        if user is not None and constant_time_compare(
+            user.get_session_auth_hash(), auth_hash
+        ):
+            user.backend = backend
+            return user
+
     user = authenticate(username=username, password=password)
     if user and user.is_active:
+        cache.set(
+            key,
+            (user.pk, user.get_session_auth_hash(), user.backend),
+            AUTH_CACHE_TTL,
+        )
         return user
     return None
 
@@ -46,6 +46,7 @@ INSTALLED_APPS = [
     "rest_framework.authtoken",
     "CMSServer",
     "drf_spectacular",
+    "cachalot",
 ]
 
 MIDDLEWARE = [
@@ -100,6 +101,34 @@ DATABASES = {
 }
 
 
+# Cache
+# Redis is used when REDIS_URL is set; otherwise an in-process cache is used.
+REDIS_URL = os.getenv("REDIS_URL")
+
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+
+# django-cachalot caches ORM reads and invalidates them on writes made through
+# Django. It is only enabled with Redis, so every process shares the same
+# invalidations; writes made outside the ORM require cachalot.api.invalidate().
+CACHALOT_ENABLED = bool(REDIS_URL)
+CACHALOT_TIMEOUT = 300
+
+# The test runner disables cachalot so query counts do not depend on cache state.
+TEST_RUNNER = "CMSServer.tests.runner.CMSTestRunner"
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 